@@ -1,4 +1,8 @@
+from __future__ import annotations
+
 import asyncio
+import functools
+import hashlib
 import json
 import logging
 import os
@@ -6,7 +10,6 @@ import tempfile
 import threading
 import time
 import warnings
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Dict, List, Optional
@@ -14,9 +17,32 @@ from typing import Callable, Dict, List, Optional
 os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
 warnings.filterwarnings("ignore", message="pkg_resources is deprecated.*", category=UserWarning)
 
-import edge_tts
+import httpx
 import openai
-import pygame
+
+try:
+    from mutagen.mp3 import MP3 as MP3Info
+except Exception:
+    MP3Info = None
+
+# pygame (SDL) and edge_tts (aiohttp) are the two heaviest imports in this
+# module and neither is needed to show the window; both load on first use.
+edge_tts = None
+pygame = None
+
+
+def _import_edge_tts() -> None:
+    global edge_tts
+    if edge_tts is None:
+        import edge_tts as _edge_tts
+        edge_tts = _edge_tts
+
+
+def _import_pygame() -> None:
+    global pygame
+    if pygame is None:
+        import pygame as _pygame
+        pygame = _pygame
 from colorama import Fore, init
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field, field_validator
@@ -34,9 +60,14 @@ APP_DIR = Path(__file__).resolve().parent
 DATA_DIR = APP_DIR / "data"
 AUDIO_DIR = APP_DIR / "audio"
 SPANISH_AUDIO_DIR = AUDIO_DIR / "spanish"
+TTS_CACHE_DIR = AUDIO_DIR / "cache"
+TTS_CACHE_MAX_BYTES = 200 * 1024 * 1024
 TEST_RESULTS_DIR = APP_DIR / "test_results"
 VOCAB_SOURCE_PATH = DATA_DIR / "vocabulary_es.json"
 VOCAB_CACHE_PATH = DATA_DIR / "vocabulary_multilingual_cache.json"
+CONCEPT_CACHE_PATH = DATA_DIR / "concept_cache.json"
+LLM_CACHE_DIR = DATA_DIR / "llm_cache"
+LLM_CACHE_TTL_S = 86400
 MAX_TTS_WORKERS = 20
 
 load_dotenv()
@@ -45,7 +76,15 @@ if not api_key:
     logger.critical("No OpenAI API key found in environment variables.")
     raise ValueError("No OpenAI API key found in environment variables.")
 
-openai.api_key = api_key
+# One client for the whole process so every request reuses the same
+# connection pool instead of paying a fresh TLS handshake. Keepalive
+# limits are raised so bursts of concept calls never close warm sockets.
+client = openai.OpenAI(
+    api_key=api_key,
+    http_client=httpx.Client(
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    ),
+)
 logger.info("OpenAI API key loaded successfully.")
 
 
@@ -146,6 +185,15 @@ LANGUAGE_ALIASES = {
 }
 
 
+_DIFFICULTY_MAP = {
+    "beginner": "Beginner",
+    "elementary": "Elementary",
+    "intermediate": "Intermediate",
+    "advanced": "Advanced",
+    "expert": "Expert",
+}
+
+
 def normalize_language_code(value: Optional[str]) -> str:
     if not value:
         return "es"
@@ -175,6 +223,78 @@ class TranslationBatch(BaseModel):
     translations: List[str] = Field(..., description="Target-language equivalents aligned by index with the supplied English items.")
 
 
+_CONCEPT_SYSTEM_PROMPT = (
+    "You are a precise language-learning content generator. Return only JSON that matches the schema. "
+    "Do not include private context, markdown, or commentary."
+)
+
+# Invariant instructions come first and the variable slots last, so the
+# provider's prompt-prefix cache keys on a byte-stable prefix across requests.
+_CONCEPT_QUERY_TEMPLATE = (
+    "Create useful language-learning items for a concept. "
+    "Return `untranslated_words` in English and `translated_words` in the target language. "
+    "Items may be words, phrases, or short sentences depending on the concept. "
+    "If the concept asks for an alphabet, include letters or characters as items. "
+    "Keep each pair aligned by index and avoid duplicates.\n"
+    "Number of items: exactly {num_items}.\n"
+    "Target language: {prompt_name} — {display} ({native_name}).\n"
+    "Orthography: {orthography}\n"
+    "Difficulty: {difficulty}.\n"
+    "Concept: {concept!r}."
+)
+
+
+def _llm_cache(ttl_s: int = LLM_CACHE_TTL_S):
+    """
+    Serves repeat LLM calls from a JSON disk cache for ttl_s seconds, keyed by
+    an exact hash of prompts, model, and response schema.
+    """
+    def decorator(func):
+        memo: Dict[str, tuple[float, BaseModel]] = {}
+
+        @functools.wraps(func)
+        def wrapper(system_prompt, user_query, pydantic_model, model="gpt-5-nano"):
+            key = hashlib.sha256(
+                json.dumps(
+                    {
+                        "model": model,
+                        "system_prompt": system_prompt,
+                        "user_query": user_query,
+                        "schema": pydantic_model.__name__,
+                    },
+                    sort_keys=True,
+                ).encode("utf-8")
+            ).hexdigest()
+            cached_at_result = memo.get(key)
+            if cached_at_result is not None:
+                cached_at, result = cached_at_result
+                if time.time() - cached_at < ttl_s:
+                    logger.info("LLM memo hit (model=%s, schema=%s).", model, pydantic_model.__name__)
+                    return result
+            path = LLM_CACHE_DIR / f"{key}.json"
+            try:
+                if path.is_file() and time.time() - path.stat().st_mtime < ttl_s:
+                    cached = pydantic_model.model_validate_json(path.read_text(encoding="utf-8"))
+                    memo[key] = (path.stat().st_mtime, cached)
+                    logger.info("LLM cache hit (model=%s, schema=%s).", model, pydantic_model.__name__)
+                    return cached
+            except Exception:
+                logger.warning("LLM cache entry was unreadable; regenerating.")
+            result = func(system_prompt, user_query, pydantic_model, model)
+            memo[key] = (time.time(), result)
+            try:
+                LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                path.write_text(result.model_dump_json(), encoding="utf-8")
+            except Exception as e:
+                logger.warning("Could not write LLM cache entry: %s", e)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+@_llm_cache()
 def call_GPT(
     system_prompt: str,
     user_query: str,
@@ -184,22 +304,104 @@ def call_GPT(
     try:
         start = time.perf_counter()
         logger.info("LLM request started (model=%s).", model)
-        response = openai.beta.chat.completions.parse(
+        first_token_at: Optional[float] = None
+        with client.beta.chat.completions.stream(
             model=model,
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_query},
             ],
             response_format=pydantic_model,
-        )
+        ) as stream:
+            for event in stream:
+                if first_token_at is None and event.type == "content.delta":
+                    first_token_at = time.perf_counter()
+            response = stream.get_final_completion()
         elapsed = time.perf_counter() - start
-        logger.info("LLM response generated successfully in %.2fs.", elapsed)
-        return response.choices[0].message.parsed
+        if first_token_at is not None:
+            logger.info(
+                "LLM response generated successfully in %.2fs (first token after %.2fs).",
+                elapsed,
+                first_token_at - start,
+            )
+        else:
+            logger.info("LLM response generated successfully in %.2fs.", elapsed)
+        parsed = response.choices[0].message.parsed
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Parsed LLM payload (truncated): %.500r", parsed)
+        return parsed
     except Exception as e:
         logger.error("Error generating LLM response: %s", e)
         raise
 
 
+def _concept_cache_key(concept: str, language_code: str, difficulty: str, num_items: int) -> str:
+    raw = f"{concept.strip().lower()}\0{language_code}\0{str(difficulty).lower()}\0{num_items}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _load_concept_cache() -> dict:
+    if not CONCEPT_CACHE_PATH.exists():
+        return {"schema_version": 1, "concepts": {}}
+    try:
+        return json.loads(CONCEPT_CACHE_PATH.read_text(encoding="utf-8"))
+    except Exception:
+        logger.warning("Concept cache could not be read; starting with an empty cache.")
+        return {"schema_version": 1, "concepts": {}}
+
+
+def _save_concept_cache(cache: dict) -> None:
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    CONCEPT_CACHE_PATH.write_text(json.dumps(cache, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def _touch(path: Path) -> None:
+    """Bumps a cache entry's mtime so eviction approximates least-recently-used."""
+    try:
+        os.utime(path, None)
+    except OSError:
+        pass
+
+
+def _sweep_tts_cache(cache_dir: Path, max_bytes: int = TTS_CACHE_MAX_BYTES) -> None:
+    """Evicts the least-recently-used clips once the cache grows past max_bytes."""
+    try:
+        entries = [(p.stat().st_mtime, p.stat().st_size, p) for p in cache_dir.glob("*.mp3")]
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    if total <= max_bytes:
+        return
+    entries.sort()
+    for _, size, path in entries:
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        if total <= max_bytes:
+            break
+    logger.info("TTS cache trimmed to %.1f MB.", total / (1024 * 1024))
+
+
+def _clip_duration_s(file_path: str) -> Optional[float]:
+    if MP3Info is None:
+        return None
+    try:
+        return float(MP3Info(file_path).info.length)
+    except Exception:
+        return None
+
+
+def _sweep_legacy_tts_files() -> None:
+    """Removes temp MP3s leaked by older builds that wrote one tempfile per TTS call."""
+    for leftover in Path(tempfile.gettempdir()).glob("language_tutor_*.mp3"):
+        try:
+            leftover.unlink()
+        except OSError:
+            pass
+
+
 def _load_cache() -> dict:
     if not VOCAB_CACHE_PATH.exists():
         return {"schema_version": 1, "topics": {}}
@@ -229,22 +431,26 @@ class Tutor:
         self.audio_files_target: Dict[str, str] = {}
         self.target_language = "es"
         self.audio_lock = threading.Lock()
-
+        self._tts_cache_dir = TTS_CACHE_DIR
+        self._tts_cache_dir.mkdir(parents=True, exist_ok=True)
+        _sweep_tts_cache(self._tts_cache_dir)
+        _sweep_legacy_tts_files()
+
+    def _ensure_mixer(self) -> None:
+        """Opens the audio device on first use so startup never pays for SDL init."""
+        _import_pygame()
+        if pygame.mixer.get_init():
+            return
         try:
             pygame.mixer.init()
             logger.info("Pygame mixer initialized successfully.")
         except Exception as e:
             logger.error("Error initializing pygame mixer: %s", e)
 
-    def map_difficulty_to_level(self, difficulty: str) -> str:
-        mapping = {
-            "beginner": "Beginner",
-            "elementary": "Elementary",
-            "intermediate": "Intermediate",
-            "advanced": "Advanced",
-            "expert": "Expert",
-        }
-        return mapping.get(str(difficulty).lower(), "Intermediate")
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def map_difficulty_to_level(difficulty: str) -> str:
+        return _DIFFICULTY_MAP.get(str(difficulty).lower(), "Intermediate")
 
     def request_concept(
         self,
@@ -262,19 +468,15 @@ class Tutor:
             profile.display,
             difficulty_label,
         )
-        system_prompt = (
-            "You are a precise language-learning content generator. Return only JSON that matches the schema. "
-            "Do not include private context, markdown, or commentary."
-        )
-        user_query = (
-            f"Create exactly {num_items} useful language-learning items for the concept: {concept!r}.\n"
-            f"Return `untranslated_words` in English and `translated_words` in {profile.prompt_name}.\n"
-            f"Target language: {profile.display} ({profile.native_name}).\n"
-            f"Orthography: {profile.sentence_hint}\n"
-            f"Difficulty: {difficulty_label}.\n"
-            "Items may be words, phrases, or short sentences depending on the concept. "
-            "If the concept asks for an alphabet, include letters or characters as items. "
-            "Keep each pair aligned by index and avoid duplicates."
+        system_prompt = _CONCEPT_SYSTEM_PROMPT
+        user_query = _CONCEPT_QUERY_TEMPLATE.format(
+            num_items=num_items,
+            prompt_name=profile.prompt_name,
+            display=profile.display,
+            native_name=profile.native_name,
+            orthography=profile.sentence_hint,
+            difficulty=difficulty_label,
+            concept=concept,
         )
         try:
             return call_GPT(system_prompt, user_query, BilingualDict)
@@ -282,6 +484,55 @@ class Tutor:
             logger.error("Failed to retrieve bilingual content: %s", e)
             return BilingualDict(untranslated_words=[], translated_words=[])
 
+    def cached_concept(
+        self,
+        concept: str,
+        num_items: int,
+        target_language: str,
+        difficulty: str = "intermediate",
+    ) -> Optional[tuple[BilingualDict, Dict[str, str]]]:
+        """
+        Returns the content and still-valid audio paths of an identical earlier
+        request, or None when the concept has not been generated before.
+        """
+        key = _concept_cache_key(concept, normalize_language_code(target_language), difficulty, num_items)
+        entry = _load_concept_cache().get("concepts", {}).get(key)
+        if not entry:
+            return None
+        content = BilingualDict(
+            untranslated_words=entry.get("untranslated_words", []),
+            translated_words=entry.get("translated_words", []),
+        )
+        audio_paths = {
+            word: path
+            for word, path in entry.get("audio_paths", {}).items()
+            if path and os.path.exists(path)
+        }
+        return content, audio_paths
+
+    def store_concept(
+        self,
+        concept: str,
+        num_items: int,
+        target_language: str,
+        difficulty: str,
+        content: BilingualDict,
+        audio_paths: Dict[str, str],
+    ) -> None:
+        code = normalize_language_code(target_language)
+        key = _concept_cache_key(concept, code, difficulty, num_items)
+        cache = _load_concept_cache()
+        cache.setdefault("concepts", {})[key] = {
+            "concept": concept,
+            "language": code,
+            "difficulty": str(difficulty).lower(),
+            "num_items": num_items,
+            "untranslated_words": content.untranslated_words,
+            "translated_words": content.translated_words,
+            "audio_paths": audio_paths,
+        }
+        _save_concept_cache(cache)
+
     def translate_entries(
         self,
         topic_id: str,
@@ -345,38 +596,47 @@ class Tutor:
             raise ValueError("Translation count did not match source count.")
         return parsed.translations
 
-    def text_to_speech(self, text: str, language: str = "es", voice_name: Optional[str] = None) -> str:
-        profile = get_language_profile(language)
-        voice = voice_name or profile.voices[profile.default_voice_label]
-        out_path = ""
-        try:
-            fd, out_path = tempfile.mkstemp(prefix="language_tutor_", suffix=".mp3")
-            os.close(fd)
+    def _tts_cache_path(self, text: str, language_code: str, voice: str) -> Path:
+        key = hashlib.sha256(f"{language_code}\0{voice}\0{text.strip().lower()}".encode("utf-8")).hexdigest()
+        return self._tts_cache_dir / f"{key}.mp3"
 
-            async def _synth() -> None:
-                communicate = edge_tts.Communicate(text=text, voice=voice, rate="-10%")
-                await communicate.save(out_path)
+    async def _synthesize_async(self, text: str, profile: LanguageProfile, voice: str) -> str:
+        out_path = self._tts_cache_path(text, profile.code, voice)
+        if out_path.is_file() and out_path.stat().st_size > 0:
+            _touch(out_path)
+            logger.debug("TTS cache hit for %s.", profile.display)
+            return str(out_path)
 
-            asyncio.run(_synth())
-            if not os.path.exists(out_path) or os.path.getsize(out_path) == 0:
+        tmp_path = out_path.with_suffix(".tmp")
+        try:
+            _import_edge_tts()
+            communicate = edge_tts.Communicate(text=text, voice=voice, rate="-10%")
+            await communicate.save(str(tmp_path))
+            if not tmp_path.is_file() or tmp_path.stat().st_size == 0:
                 raise ValueError("No audio data received.")
+            os.replace(tmp_path, out_path)
             logger.info("Text-to-speech conversion successful for %s.", profile.display)
-            return out_path
+            return str(out_path)
         except Exception as e:
-            if out_path:
-                try:
-                    os.remove(out_path)
-                except OSError:
-                    pass
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             logger.error("Error in text-to-speech conversion: %s", e)
             return ""
 
+    def text_to_speech(self, text: str, language: str = "es", voice_name: Optional[str] = None) -> str:
+        profile = get_language_profile(language)
+        voice = voice_name or profile.voices[profile.default_voice_label]
+        return asyncio.run(self._synthesize_async(text, profile, voice))
+
     def text_to_speech_batch(
         self,
         items: List[str],
         language: str = "es",
         voice_name: Optional[str] = None,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        on_item: Optional[Callable[[str, str], None]] = None,
         max_rounds: int = 3,
         retry_delay_s: float = 0.6,
     ) -> Dict[str, str]:
@@ -390,8 +650,9 @@ class Tutor:
         start = time.perf_counter()
         progress_step = 1 if total <= 20 else 5 if total <= 100 else 10
 
-        def _synth(item: str) -> tuple[str, str]:
-            return item, self.text_to_speech(item, language, voice_name)
+        # Resolve the voice once for the whole batch so workers skip the
+        # per-item profile lookup and default resolution.
+        voice = voice_name or profile.voices[profile.default_voice_label]
 
         if progress_callback:
             try:
@@ -399,7 +660,26 @@ class Tutor:
             except Exception:
                 pass
 
-        remaining = unique_items
+        # Resolve disk-cache hits up front; only unknown items go to the pool.
+        for item in unique_items:
+            cached = self._tts_cache_path(item, profile.code, voice)
+            if cached.is_file() and cached.stat().st_size > 0:
+                _touch(cached)
+                results[item] = str(cached)
+                if on_item:
+                    try:
+                        on_item(item, results[item])
+                    except Exception:
+                        pass
+        if results:
+            logger.info("TTS cache satisfied %d/%d item(s) for %s.", len(results), total, profile.display)
+            if progress_callback:
+                try:
+                    progress_callback(len(results), total)
+                except Exception:
+                    pass
+
+        remaining = [item for item in unique_items if item not in results]
         for round_idx in range(1, max_rounds + 1):
             if not remaining:
                 break
@@ -422,21 +702,29 @@ class Tutor:
                     max_workers,
                 )
 
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = {executor.submit(_synth, item): item for item in remaining}
-                completed = 0
-                for future in as_completed(futures):
-                    item = futures[future]
-                    try:
-                        _, path = future.result()
-                    except Exception as e:
-                        logger.error("TTS task failed for '%s': %s", item, e)
-                        path = ""
+            async def _run_round(items: List[str]) -> None:
+                semaphore = asyncio.Semaphore(max_workers)
+
+                async def _one(item: str) -> tuple[str, str]:
+                    async with semaphore:
+                        try:
+                            return item, await self._synthesize_async(item, profile, voice)
+                        except Exception as e:
+                            logger.error("TTS task failed for '%s': %s", item, e)
+                            return item, ""
 
+                completed = 0
+                for coro in asyncio.as_completed([_one(item) for item in items]):
+                    item, path = await coro
                     if path:
                         results[item] = path
+                        if on_item:
+                            try:
+                                on_item(item, path)
+                            except Exception:
+                                pass
                     completed += 1
-                    if completed % progress_step == 0 or completed == len(remaining):
+                    if completed % progress_step == 0 or completed == len(items):
                         logger.info("TTS progress: %d/%d completed.", len(results), total)
                     if progress_callback:
                         try:
@@ -444,6 +732,8 @@ class Tutor:
                         except Exception:
                             pass
 
+            asyncio.run(_run_round(remaining))
+
             remaining = [item for item in remaining if item not in results]
             if remaining and round_idx < max_rounds:
                 time.sleep(retry_delay_s)
@@ -455,15 +745,51 @@ class Tutor:
         logger.info("TTS generation finished: %d/%d succeeded in %.2fs.", len(results), total, elapsed)
         return results
 
+    def load_sounds(self, audio_paths: Dict[str, str]) -> Dict[str, pygame.mixer.Sound]:
+        """
+        Decodes audio files into reusable Sound objects so replays skip the
+        per-clip load/unload cycle of the music channel.
+        """
+        self._ensure_mixer()
+        sounds: Dict[str, pygame.mixer.Sound] = {}
+        for word, path in audio_paths.items():
+            try:
+                sounds[word] = pygame.mixer.Sound(path)
+            except Exception as e:
+                logger.warning("Could not preload sound for '%s': %s", word, e)
+        return sounds
+
+    def play_sound(self, sound: pygame.mixer.Sound) -> None:
+        self._ensure_mixer()
+        try:
+            with self.audio_lock:
+                channel = sound.play()
+                logger.info("Playing audio.")
+                # One long sleep covers the clip; only the tail is polled.
+                length = sound.get_length()
+                if length > 0.1:
+                    time.sleep(length - 0.05)
+                while channel is not None and channel.get_busy():
+                    time.sleep(0.05)
+                logger.info("Finished playing audio.")
+        except Exception as e:
+            logger.error("Error playing audio: %s", e)
+            print(Fore.RED + "Error playing audio. Check logs for details.")
+
     def play_audio(self, file_path: str) -> None:
+        self._ensure_mixer()
         try:
             with self.audio_lock:
                 pygame.mixer.music.load(file_path)
                 pygame.mixer.music.play()
                 logger.info("Playing audio.")
 
+                # One long sleep covers the clip; only the tail is polled.
+                duration = _clip_duration_s(file_path)
+                if duration and duration > 0.1:
+                    time.sleep(duration - 0.05)
                 while pygame.mixer.music.get_busy():
-                    pygame.time.Clock().tick(10)
+                    time.sleep(0.05)
 
                 pygame.mixer.music.unload()
                 logger.info("Finished playing audio.")
@@ -6,8 +6,10 @@ import tkinter.font as tkfont
 from tkinter import ttk, messagebox, scrolledtext, colorchooser
 from PIL import ImageGrab
 import threading
+import queue
 import random
 import json
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 
@@ -27,19 +29,75 @@ from class_tutor import (
 from class_scroll import ScrollableFrame
 
 # Configure logging
+LOG_FILE_PATH = Path(__file__).resolve().parent / "PGB_Model_Log.log"
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        # logging.FileHandler("PGB_Model_Log.log"),
-        logging.StreamHandler()
-    ],
+    handlers=[logging.StreamHandler()],
 )
+# class_tutor configures the root logger first on import, so the file handler
+# is attached explicitly instead of relying on basicConfig.
+_file_handler = logging.FileHandler(LOG_FILE_PATH, encoding="utf-8")
+_file_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+logging.getLogger().addHandler(_file_handler)
 logger = logging.getLogger(__name__)
 
+
+def tail_lines(path, max_lines=500):
+    """Returns up to the last max_lines lines of a file without reading all of it."""
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            pos = f.tell()
+            buf = bytearray()
+            while pos > 0 and buf.count(b"\n") <= max_lines:
+                step = min(8192, pos)
+                pos -= step
+                f.seek(pos)
+                buf[:0] = f.read(step)
+    except OSError:
+        return []
+    return buf.decode("utf-8", "replace").splitlines()[-max_lines:]
+
 BASE_DIR = SPANISH_AUDIO_DIR
 VOCAB_JSON = VOCAB_SOURCE_PATH
 
+
+def _style_as_labelframe(gui, widget):
+    widget.configure(style="Custom.TLabelframe")
+    widget.configure(borderwidth=2, relief="groove")
+
+
+def _style_as_label(gui, widget):
+    widget.configure(style="Custom.TLabel")
+
+
+def _style_as_treeview(gui, widget):
+    widget.configure(style="Custom.Treeview")
+
+
+def _style_as_toplevel(gui, widget):
+    widget.configure(bg=gui.current_bg_color)
+
+
+def _style_as_text(gui, widget):
+    widget.configure(bg=gui.current_bg_color, fg=gui.current_fg_color)
+
+
+# Dispatch table for the color walk; subclasses resolve through the MRO scan
+# in apply_color_recursive, which stops at the first matching base.
+_COLOR_HANDLERS = {
+    ttk.LabelFrame: _style_as_labelframe,
+    ttk.Frame: _style_as_labelframe,
+    ttk.Label: _style_as_label,
+    ttk.Button: _style_as_label,
+    ttk.Radiobutton: _style_as_label,
+    ttk.Treeview: _style_as_treeview,
+    tk.Toplevel: _style_as_toplevel,
+    scrolledtext.ScrolledText: _style_as_text,
+}
+
 class TutorGUI:
     """
     A graphical user interface for the Language Tutor using Tkinter.
@@ -72,12 +130,15 @@ class TutorGUI:
         self.primary_font_family = self.pick_font_family(
             ("SF Pro Text", "Avenir Next", "Helvetica", "Arial", "TkDefaultFont")
         )
+        self.tree_font_family = self.primary_font_family
         self.body_font = (self.primary_font_family, self.current_font_size)
         self.section_font = (self.primary_font_family, self.current_font_size + 2, "bold")
         self.header_font = (self.primary_font_family, self.current_font_size + 8, "bold")
         self.subheader_font = (self.primary_font_family, self.current_font_size + 1)
         self.progress_running = False
         self.play_all_running = False
+        self.style = ttk.Style(self.root)
+        self._font_after_id = None
 
         # build UI into self.content instead of self.root
         self.create_menu()               # menu bar stays on root
@@ -90,6 +151,20 @@ class TutorGUI:
 
         self.audio_files_en = {}
         self.audio_files_target = {}
+        self.sound_cache = {}
+        self._row_data = []  # (english, target) pairs mirroring the tree rows
+        self._item_index = {}  # tree item id -> row index
+
+        # One persistent worker serializes test-mode playback; the bounded
+        # queue coalesces rapid repeated clicks instead of stacking threads.
+        self._audio_queue = queue.Queue(maxsize=1)
+        threading.Thread(target=self._audio_worker, daemon=True).start()
+
+    def _audio_worker(self):
+        """Plays queued audio files one at a time on a background thread."""
+        while True:
+            audio_file = self._audio_queue.get()
+            self.play_audio_thread(audio_file)
 
     def create_menu(self):
         """
@@ -101,6 +176,7 @@ class TutorGUI:
         file_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Export Screenshot", command=self.export_screenshot)
+        file_menu.add_command(label="View Logs", command=self.view_logs)
 
         appearance_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Appearance", menu=appearance_menu)
@@ -131,6 +207,24 @@ class TutorGUI:
                 "Could not export screenshot. On macOS, grant Screen Recording permission to the Python interpreter, then try again.",
             )
 
+    def view_logs(self):
+        """Shows the tail of the application log in a separate window."""
+        def load():
+            lines = tail_lines(LOG_FILE_PATH)
+            self.root.after(0, lambda: self.show_log_window(lines))
+
+        threading.Thread(target=load, daemon=True).start()
+
+    def show_log_window(self, lines):
+        window = tk.Toplevel(self.root)
+        window.title("Logs")
+        window.geometry("900x500")
+        text = scrolledtext.ScrolledText(window, wrap=tk.WORD, font=self.body_font)
+        text.pack(fill="both", expand=True, padx=10, pady=10)
+        text.insert(tk.END, "\n".join(lines) if lines else "No log entries yet.")
+        text.configure(state="disabled")
+        text.see(tk.END)
+
     def change_colors(self):
         """
         Opens color chooser dialogs to allow the user to select background and text colors.
@@ -155,42 +249,39 @@ class TutorGUI:
         # Apply to root window
         self.root.configure(bg=self.current_bg_color)
 
-        # Apply to all frames and widgets
-        for widget in self.root.winfo_children():
-            self.apply_color_recursive(widget)
+        # One restyle pass covers every Custom.* style; per-widget settings follow.
+        self.configure_styles()
+
+        # Retarget the row tags once; ttk repaints the rows without touching
+        # them individually. The default zebra striping yields to the chosen
+        # colors so rows stay readable on any background.
+        self.translations_tree.tag_configure("even", background=self.current_bg_color,
+                                             foreground=self.current_fg_color)
+        self.translations_tree.tag_configure("odd", background=self.current_bg_color,
+                                             foreground=self.current_fg_color)
+
+        self.apply_color_recursive(self.root)
 
     def apply_color_recursive(self, widget):
         """
-        Recursively applies colors to widgets.
+        Applies colors to the widget tree with an iterative breadth-first walk.
         """
-        try:
-            if isinstance(widget, (ttk.LabelFrame, ttk.Frame)):
-                widget.configure(style="Custom.TLabelframe")
-                widget.configure(borderwidth=2, relief="groove")
-            elif isinstance(widget, (ttk.Label, ttk.Button, ttk.Radiobutton)):
-                widget.configure(style="Custom.TLabel")
-            elif isinstance(widget, ttk.Treeview):
-                widget.configure(style="Custom.Treeview")
-            elif isinstance(widget, tk.Toplevel):
-                widget.configure(bg=self.current_bg_color)
-                for child in widget.winfo_children():
-                    self.apply_color_recursive(child)
-            elif isinstance(widget, scrolledtext.ScrolledText):
-                widget.configure(bg=self.current_bg_color, fg=self.current_fg_color)
-        except tk.TclError:
-            pass  # Some widgets may not support certain configurations
-
-        # Recurse into child widgets
-        for child in widget.winfo_children():
-            self.apply_color_recursive(child)
-
-        # Define custom styles
-        style = ttk.Style()
-        style.configure("Custom.TLabelframe", background=self.current_bg_color, foreground=self.current_fg_color)
-        style.configure("Custom.TLabel", background=self.current_bg_color, foreground=self.current_fg_color)
-        style.configure("Custom.Treeview", background=self.current_bg_color, foreground=self.current_fg_color,
-                        fieldbackground=self.current_bg_color)
-        style.map("Custom.Treeview", background=[('selected', '#ececec')], foreground=[('selected', '#000000')])
+        pending = deque(widget.winfo_children())
+        visited = set()
+        while pending:
+            current = pending.popleft()
+            if id(current) in visited:
+                continue
+            visited.add(id(current))
+            try:
+                for base in type(current).__mro__:
+                    handler = _COLOR_HANDLERS.get(base)
+                    if handler is not None:
+                        handler(self, current)
+                        break
+            except tk.TclError:
+                pass  # Some widgets may not support certain configurations
+            pending.extend(current.winfo_children())
 
     def pick_font_family(self, candidates):
         try:
@@ -203,7 +294,7 @@ class TutorGUI:
         return "TkDefaultFont"
 
     def configure_styles(self):
-        style = ttk.Style()
+        style = self.style
         try:
             style.theme_use("clam")
         except tk.TclError:
@@ -225,10 +316,14 @@ class TutorGUI:
         style.configure("Chip.TButton", font=(self.primary_font_family, self.current_font_size - 1), padding=(10, 4))
         style.configure("ChipActive.TButton", font=(self.primary_font_family, self.current_font_size - 1, "bold"), padding=(10, 4))
 
-        style.configure("Treeview.Heading", font=(self.primary_font_family, self.current_font_size, "bold"), background="#e2e8f0")
-        style.configure("Treeview", font=self.body_font, rowheight=self.current_font_size + 12)
+        style.configure("Treeview.Heading", font=(self.tree_font_family, self.current_font_size, "bold"), background="#e2e8f0")
+        style.configure("Treeview", font=(self.tree_font_family, self.current_font_size), rowheight=self.current_font_size + 12)
         style.map("Treeview", background=[('selected', '#dbeafe')], foreground=[('selected', '#0f172a')])
 
+        style.configure("Custom.Treeview", background=self.current_bg_color, foreground=self.current_fg_color,
+                        fieldbackground=self.current_bg_color)
+        style.map("Custom.Treeview", background=[('selected', '#ececec')], foreground=[('selected', '#000000')])
+
     def create_header(self, parent):
         header_frame = ttk.Frame(parent, style="TFrame")
         header_frame.pack(fill="x", padx=20, pady=(16, 10))
@@ -377,6 +472,7 @@ class TutorGUI:
         self.translations_tree.tag_configure("even", background="#ffffff")
 
         self.translations_tree.pack(fill="both", expand=True, side="left", padx=(0, 10), pady=10)
+        self.translations_tree.bind('<ButtonRelease-1>', self.on_tree_click)
         scrollbar = ttk.Scrollbar(display_frame, orient=tk.VERTICAL,
                                   command=self.translations_tree.yview)
         scrollbar.pack(side="right", fill="y", pady=10)
@@ -467,10 +563,9 @@ class TutorGUI:
             if not available or candidate in available:
                 family = candidate
                 break
+        self.tree_font_family = family
         try:
-            style = ttk.Style()
-            style.configure("Treeview", font=(family, self.current_font_size), rowheight=self.current_font_size + 10)
-            style.configure("Treeview.Heading", font=(family, self.current_font_size, "bold"))
+            self.configure_styles()
         except Exception as e:
             logger.warning("Could not update language font family: %s", e)
 
@@ -495,9 +590,19 @@ class TutorGUI:
             messagebox.showinfo("Font Size", f"Minimum font size of {self.min_font_size} reached.")
 
     def update_font_size(self):
+        """
+        Schedules a restyle for the new font size, coalescing rapid +/- clicks
+        into a single relayout.
+        """
+        if self._font_after_id is not None:
+            self.root.after_cancel(self._font_after_id)
+        self._font_after_id = self.root.after(75, self.apply_font_styles)
+
+    def apply_font_styles(self):
         """
         Updates the font size of the Treeview and adjusts the row height accordingly.
         """
+        self._font_after_id = None
         try:
             self.body_font = (self.primary_font_family, self.current_font_size)
             self.section_font = (self.primary_font_family, self.current_font_size + 2, "bold")
@@ -552,20 +657,31 @@ class TutorGUI:
 
     def process_learning(self, concept, language, voice_name, num_items, difficulty_level):
         try:
-            logger.info(
-                "Starting concept generation for %r (%s, %d items, %s).",
-                concept,
-                language,
-                num_items,
-                difficulty_level,
-            )
-            bilingual_content = self.tutor.request_concept(concept, num_items, language, difficulty_level)
-            if not bilingual_content.translated_words:
-                self.root.after(0, lambda: self.display_message("Failed to retrieve content."))
-                self.set_status("Concept generation failed.", busy=False)
-                return
+            cached = self.tutor.cached_concept(concept, num_items, language, difficulty_level)
+            if cached is not None:
+                bilingual_content, cached_audio = cached
+                self.audio_files_target = cached_audio
+                logger.info(
+                    "Concept cache hit for %r (%d item(s), %d clip(s) still on disk).",
+                    concept,
+                    len(bilingual_content.translated_words),
+                    len(cached_audio),
+                )
+            else:
+                logger.info(
+                    "Starting concept generation for %r (%s, %d items, %s).",
+                    concept,
+                    language,
+                    num_items,
+                    difficulty_level,
+                )
+                bilingual_content = self.tutor.request_concept(concept, num_items, language, difficulty_level)
+                if not bilingual_content.translated_words:
+                    self.root.after(0, lambda: self.display_message("Failed to retrieve content."))
+                    self.set_status("Concept generation failed.", busy=False)
+                    return
 
-            logger.info("LLM returned %d item(s).", len(bilingual_content.translated_words))
+                logger.info("LLM returned %d item(s).", len(bilingual_content.translated_words))
 
             # Save content for testing later
             self.last_bilingual_content = bilingual_content
@@ -574,11 +690,15 @@ class TutorGUI:
             target_lang_display = self.get_language_display(language)
 
             def update_table():
-                self.translations_tree.heading("Target Language", text=target_lang_display)
-                for idx, (eng, target) in enumerate(zip(bilingual_content.untranslated_words, bilingual_content.translated_words)):
-                    tag = "even" if idx % 2 == 0 else "odd"
-                    self.translations_tree.insert('', tk.END, values=(eng, target, "▶"), tags=(tag,))
-                self.translations_tree.bind('<ButtonRelease-1>', self.on_tree_click)
+                pending = {
+                    word for word in bilingual_content.translated_words
+                    if word not in self.audio_files_target
+                }
+                self.populate_translations(
+                    zip(bilingual_content.untranslated_words, bilingual_content.translated_words),
+                    heading=target_lang_display,
+                    pending_audio=pending,
+                )
                 self.play_all_button.config(state='normal')
 
             self.root.after(0, update_table)
@@ -586,6 +706,9 @@ class TutorGUI:
             # Prepare audio for all words
             self.set_status(f"Generating audio for {len(bilingual_content.translated_words)} item(s)...", busy=True)
             self.prepare_audio_files(bilingual_content, language, voice_name)
+            self.tutor.store_concept(
+                concept, num_items, language, difficulty_level, bilingual_content, self.audio_files_target
+            )
             self.set_status("Ready", busy=False)
 
         except Exception as e:
@@ -598,23 +721,79 @@ class TutorGUI:
     def get_language_display(self, language_code):
         return get_language_profile(language_code).display
 
+    def populate_translations(self, rows, heading=None, pending_audio=None):
+        """
+        Fills the translations tree in one tight loop. Must run on the main
+        thread; the values and tags are precomputed so the loop does nothing
+        but cross into Tcl. Words listed in pending_audio show a placeholder
+        in the Play column until mark_audio_ready flips them.
+        """
+        tree = self.translations_tree
+        if heading:
+            tree.heading("Target Language", text=heading)
+        tree.delete(*tree.get_children())
+        rows = list(rows)
+        pending_audio = pending_audio or ()
+        prepared = [
+            ((eng, target, "…" if target in pending_audio else "▶"),
+             ("even" if idx % 2 == 0 else "odd",))
+            for idx, (eng, target) in enumerate(rows)
+        ]
+        self._row_data = rows
+        self._item_index = {}
+        insert = tree.insert
+        for idx, (values, tags) in enumerate(prepared):
+            self._item_index[insert('', tk.END, values=values, tags=tags)] = idx
+        tree.yview_moveto(0.0)
+
+    def mark_audio_ready(self, word):
+        """Flips the Play cell of every row whose clip just arrived."""
+        for item_id, idx in self._item_index.items():
+            if self._row_data[idx][1] == word:
+                try:
+                    self.translations_tree.set(item_id, "Play", "▶")
+                except tk.TclError:
+                    pass  # The tree was repopulated in the meantime.
+
     def prepare_audio_files(self, bilingual_content, language, voice_name=None):
         """
         Pre-generates audio files for target language words based on the selected language.
         Stores the file paths in a dictionary for easy access during playback.
         """
         self.audio_files_en = {}  # English audio not generated intentionally.
-        total = len(bilingual_content.translated_words)
+        words = bilingual_content.translated_words
 
-        def progress_callback(done, total_items):
-            self.set_status(f"Generating audio... {done}/{total_items}", busy=True)
+        # Reuse clips from the previous run that are still on disk; only the
+        # remainder goes through the (already concurrent) TTS batch.
+        reusable = {
+            word: path
+            for word, path in self.audio_files_target.items()
+            if word in set(words) and path and os.path.exists(path)
+        }
+        missing = [word for word in words if word not in reusable]
 
-        self.audio_files_target = self.tutor.text_to_speech_batch(
-            bilingual_content.translated_words,
-            language,
-            voice_name,
-            progress_callback=progress_callback,
-        )
+        # Publish paths as soon as each clip lands so per-row playback works
+        # before the whole batch has finished.
+        self.audio_files_target = reusable
+
+        if missing:
+            def progress_callback(done, total_items):
+                self.set_status(f"Generating audio... {done}/{total_items}", busy=True)
+
+            def on_item(word, path):
+                self.audio_files_target[word] = path
+                self.root.after(0, self.mark_audio_ready, word)
+
+            generated = self.tutor.text_to_speech_batch(
+                missing,
+                language,
+                voice_name,
+                progress_callback=progress_callback,
+                on_item=on_item,
+            )
+            self.audio_files_target.update(generated)
+
+        self.sound_cache = self.tutor.load_sounds(self.audio_files_target)
 
     def on_tree_click(self, event):
         """
@@ -625,9 +804,11 @@ class TutorGUI:
         if not item:
             return
 
-        values = self.translations_tree.item(item, 'values')
         if column == '#3':  # 'Play' column
-            target_word = values[1]
+            row_index = self._item_index.get(item)
+            if row_index is None:
+                return
+            target_word = self._row_data[row_index][1]
             audio_file = self.audio_files_target.get(target_word)
             if audio_file and os.path.exists(audio_file):
                 threading.Thread(target=self.play_audio_thread, args=(audio_file,), daemon=True).start()
@@ -665,10 +846,11 @@ class TutorGUI:
         """
         try:
             self.set_status("Playing all audio...", busy=False)
-            items = self.translations_tree.get_children()
-            for item in items:
-                values = self.translations_tree.item(item, 'values')
-                target_word = values[1]
+            for _eng, target_word in list(self._row_data):
+                sound = self.sound_cache.get(target_word)
+                if sound is not None:
+                    self.tutor.play_sound(sound)
+                    continue
                 audio_target = self.audio_files_target.get(target_word)
                 if audio_target and os.path.exists(audio_target):
                     self.tutor.play_audio(audio_target)
@@ -703,12 +885,7 @@ class TutorGUI:
         self.difficulty_var.set("beginner")
 
         self.set_language("zh")
-        self.translations_tree.delete(*self.translations_tree.get_children())
-        self.translations_tree.heading("Target Language", text=self.get_language_display("zh"))
-        for idx, (eng, target) in enumerate(sample_pairs):
-            tag = "even" if idx % 2 == 0 else "odd"
-            self.translations_tree.insert('', tk.END, values=(eng, target, "▶"), tags=(tag,))
-
+        self.populate_translations(sample_pairs, heading=self.get_language_display("zh"))
         self.play_all_button.config(state='normal')
 
     # ====== Testing Component Methods ======
@@ -734,12 +911,25 @@ class TutorGUI:
             messagebox.showwarning("Test Error", "No content available for testing. Please learn a concept first.")
             return
 
-        # Prepare test questions as a list of tuples (english, target)
-        self.test_questions = list(zip(self.last_bilingual_content.untranslated_words,
-                                       self.last_bilingual_content.translated_words))
-        random.shuffle(self.test_questions)
+        # Questions are (english, target) pairs addressed through a shuffled
+        # index array over the two content lists, so no per-test tuple list
+        # needs to be materialized.
+        self._question_order = list(range(len(self.last_bilingual_content.untranslated_words)))
+        random.shuffle(self._question_order)
+        self._question_idx = 0
+        # The vocabulary is fixed for the duration of a test, so build the
+        # deduplicated, sorted option pools once instead of per question.
+        self._verbal_pool = sorted(set(self.last_bilingual_content.translated_words))
+        self._audio_pool = sorted(set(self.last_bilingual_content.untranslated_words))
+        # Stat each audio file once up front so Play Audio clicks never
+        # touch the filesystem on the UI thread.
+        self._valid_audio = {
+            word: path
+            for word, path in self.audio_files_target.items()
+            if path and os.path.exists(path)
+        }
         self.score = 0
-        self.total_questions = len(self.test_questions)
+        self.total_questions = len(self._question_order)
         self.question_count = 0
         self.incorrect_items = []
 
@@ -767,8 +957,12 @@ class TutorGUI:
         settings_frame.pack(fill="x", pady=10)
 
         ttk.Label(settings_frame, text="Max Options:").pack(side="left", padx=5)
-        self.max_display_entry = ttk.Entry(settings_frame, width=5)
-        self.max_display_entry.insert(0, "5")
+        # The parsed value is cached via a variable trace so each question
+        # reads a plain int instead of round-tripping through Tcl.
+        self.max_display_var = tk.StringVar(value="5")
+        self.max_display_var.trace_add("write", self._update_max_display)
+        self._max_display = 5
+        self.max_display_entry = ttk.Entry(settings_frame, width=5, textvariable=self.max_display_var)
         self.max_display_entry.pack(side="left", padx=5)
 
         # ----- Question Label (in italic) -----
@@ -790,7 +984,8 @@ class TutorGUI:
         # Variable to hold user's answer
         self.selected_option = tk.StringVar()
 
-        # List to store radio button widgets for each question
+        # Pool of reusable radio button widgets; grown on demand and
+        # reconfigured per question instead of destroyed and recreated.
         self.radio_buttons = []
 
         # ----- Submit Button -----
@@ -801,15 +996,30 @@ class TutorGUI:
         self.final_feedback_label = ttk.Label(self.test_frame, text="", font=("Helvetica", 14))
         self.final_feedback_label.pack(pady=10)
 
+    def _update_max_display(self, *_args):
+        """
+        Re-parses the Max Options entry whenever it changes (default to 4 if invalid).
+        """
+        try:
+            max_display = int(self.max_display_var.get())
+            if max_display < 2:
+                max_display = 4
+        except ValueError:
+            max_display = 4
+        self._max_display = max_display
+
     def play_current_audio(self):
         """
         Plays the audio associated with the current question (used in audio test mode).
         """
         if self.current_question and self.test_mode == "audio":
             target_text = self.current_question[1]
-            audio_file = self.audio_files_target.get(target_text)
-            if audio_file and os.path.exists(audio_file):
-                threading.Thread(target=self.play_audio_thread, args=(audio_file,), daemon=True).start()
+            audio_file = self._valid_audio.get(target_text)
+            if audio_file:
+                try:
+                    self._audio_queue.put_nowait(audio_file)
+                except queue.Full:
+                    pass  # a click is already pending; drop the duplicate
             else:
                 messagebox.showerror("Audio Error", "No audio available for this question.")
 
@@ -818,10 +1028,9 @@ class TutorGUI:
         Displays the next question in the test window.
         Saves results when the test is complete.
         """
-        # Clear previous radio buttons
+        # Hide the pooled radio buttons from the previous question.
         for rb in self.radio_buttons:
-            rb.destroy()
-        self.radio_buttons.clear()
+            rb.pack_forget()
         self.selected_option.set("")
         self.final_feedback_label.config(text="")
 
@@ -834,7 +1043,7 @@ class TutorGUI:
         else:
             self.play_audio_button.pack(pady=5)
 
-        if not self.test_questions:
+        if self._question_idx >= self.total_questions:
             # Test finished: hide submit button and options; display final feedback.
             percentage = (self.score / self.total_questions) * 100 if self.total_questions > 0 else 0
             feedback = (
@@ -844,9 +1053,12 @@ class TutorGUI:
             )
             final_text = f"Final Score: {self.score}/{self.total_questions}\nFeedback: {feedback}"
             if self.incorrect_items:
-                final_text += "\n\nIncorrect Items:\n"
-                for order, question, correct, _ in sorted(self.incorrect_items, key=lambda x: x[0]):
-                    final_text += f"{order}. {question} --> {correct}\n"
+                # Items are appended in ascending question order, so no
+                # sort is needed; join keeps the build linear.
+                parts = ["\n\nIncorrect Items:\n"]
+                parts.extend(f"{order}. {question} --> {correct}\n"
+                             for order, question, correct, _ in self.incorrect_items)
+                final_text += "".join(parts)
 
             self.question_label.config(text="Test Completed!")
             self.submit_button.pack_forget()
@@ -858,46 +1070,68 @@ class TutorGUI:
             self.save_test_results(self.test_mode)
             return
 
-        # Get the next question from the list.
-        self.current_question = self.test_questions.pop(0)
+        # Build the next question from the shuffled index; bind it to a
+        # local since the rest of this method only reads it.
+        content = self.last_bilingual_content
+        i = self._question_order[self._question_idx]
+        self._question_idx += 1
+        question = self.current_question = (content.untranslated_words[i],
+                                            content.translated_words[i])
 
-        # Determine max options from entry (default to 4 if invalid)
-        try:
-            max_display = int(self.max_display_entry.get())
-            if max_display < 2:
-                max_display = 4
-        except:
-            max_display = 4
+        max_display = self._max_display
 
         if self.test_mode == "verbal":
-            question_text = f'What is the translation for:\n\n---- "{self.current_question[0]}" ----'
-            correct_answer = self.current_question[1]
-            all_options = set(self.last_bilingual_content.translated_words)
+            question_text = f'What is the translation for:\n\n---- "{question[0]}" ----'
+            correct_answer = question[1]
+            pool = self._verbal_pool
         else:
             question_text = "Listen to the audio and select the correct English sentence."
-            correct_answer = self.current_question[0]
-            all_options = set(self.last_bilingual_content.untranslated_words)
+            correct_answer = question[0]
+            pool = self._audio_pool
 
         self.question_label.config(text=question_text)
 
         # Prepare options: include correct answer plus distractors.
-        all_options.discard(correct_answer)
-        distractors = random.sample(sorted(all_options), min(max_display - 1, len(all_options)))
+        needed = max_display - 1
+        if len(pool) <= needed:
+            # Tiny vocabulary: every other option is a distractor, so there
+            # is nothing to sample.
+            distractors = [opt for opt in pool if opt != correct_answer]
+        elif len(pool) > needed * 4:
+            # Large pool: rejection sampling picks the distractors in
+            # O(needed) expected time instead of filtering the whole
+            # vocabulary each question.
+            seen = {correct_answer}
+            distractors = []
+            while len(distractors) < needed:
+                option = random.choice(pool)
+                if option not in seen:
+                    seen.add(option)
+                    distractors.append(option)
+        else:
+            candidates = [opt for opt in pool if opt != correct_answer]
+            distractors = random.sample(candidates, min(needed, len(candidates)))
         options = distractors + [correct_answer]
         random.shuffle(options)
 
-        # Create radio buttons for options
-        for opt in options:
-            rb = ttk.Radiobutton(self.options_frame, text=opt, variable=self.selected_option, value=opt)
+        # Reconfigure pooled radio buttons for the new options; Tk widget
+        # creation is expensive, so the pool only grows when a question
+        # needs more options than any before it.
+        while len(self.radio_buttons) < len(options):
+            self.radio_buttons.append(
+                ttk.Radiobutton(self.options_frame, variable=self.selected_option))
+        for rb, opt in zip(self.radio_buttons, options):
+            rb.configure(text=opt, value=opt)
             rb.pack(fill="x", padx=5, pady=5, anchor="w")
-            self.radio_buttons.append(rb)
 
     def check_answer(self):
         """
         Records the user's answer for the current question and moves to the next question.
         Provides partial feedback immediately if the answer is incorrect.
         """
-        if not self.selected_option.get():
+        # Read the Tk variable once; each .get() round-trips to Tcl.
+        answer = self.selected_option.get()
+        if not answer:
             messagebox.showwarning("Select an answer", "Please select an answer.")
             return
 
@@ -906,10 +1140,10 @@ class TutorGUI:
         else:
             correct_answer = self.current_question[0]
 
-        if self.selected_option.get() != correct_answer:
+        if answer != correct_answer:
             # Record the incorrect item: question order, question text, correct answer, and user's answer.
             self.incorrect_items.append(
-                (self.question_count, self.current_question[0], correct_answer, self.selected_option.get()))
+                (self.question_count, self.current_question[0], correct_answer, answer))
             # Display partial feedback for incorrect answer.
             self.final_feedback_label.config(text=f"Incorrect! Correct answer: {correct_answer}")
             self.submit_button.config(state="disabled")
@@ -1011,11 +1245,10 @@ class TutorGUI:
             self.last_bilingual_content = bilingual
 
             def update_table():
-                self.translations_tree.delete(*self.translations_tree.get_children())
-                self.translations_tree.heading("Target Language", text=self.get_language_display(language))
-                for idx, (eng, target) in enumerate(zip(english_entries, target_entries)):
-                    tag = "even" if idx % 2 == 0 else "odd"
-                    self.translations_tree.insert("", tk.END, values=(eng, target, "▶"), tags=(tag,))
+                self.populate_translations(
+                    zip(english_entries, target_entries),
+                    heading=self.get_language_display(language),
+                )
                 self.play_all_button.config(state='normal')
 
             self.root.after(0, update_table)
@@ -1065,6 +1298,8 @@ class TutorGUI:
             )
             self.audio_files_target.update(generated)
 
+        self.sound_cache = self.tutor.load_sounds(self.audio_files_target)
+
     def save_test_results(self, test_mode: str):
         """
         Saves the results of the completed test (orthographic or phonologic)